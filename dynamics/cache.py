@@ -4,8 +4,8 @@
 import tempfile
 import threading
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from time import time
 from typing import ClassVar
 
 import aiosqlite
@@ -39,12 +39,11 @@ class SQLiteCacheBase(ABC):
     _set_pragma = "PRAGMA {}"
     _set_pragma_equal = "PRAGMA {}={}"
 
-    _get_sql = "SELECT value, exp FROM cache WHERE key = :key"
+    _get_sql = "SELECT value FROM cache WHERE key = :key AND exp > :now"
     _set_sql = (
         "INSERT INTO cache (key, value, exp) VALUES (:key, :value, :exp) "
         "ON CONFLICT(key) DO UPDATE SET value = :value, exp = :exp"
     )
-    _delete_sql = "DELETE FROM cache WHERE key = :key"
     _clear_sql = "DELETE FROM cache"
 
     def __init__(self, *, filename: str, path: Optional[str] = None) -> None:
@@ -73,7 +72,7 @@ def create_table_if_not_exist(self) -> None:  # pragma: no cover
 
     @staticmethod
     def _exp_timestamp(timeout: int = DEFAULT_TIMEOUT) -> float:
-        return (datetime.now(timezone.utc) + timedelta(seconds=timeout)).timestamp()
+        return time() + timeout
 
     @staticmethod
     def _stream(value: Any) -> bytes:
@@ -126,6 +125,9 @@ def con(self) -> sqlite3.Connection:
         connection = self.connections.get(thead_id)
         if connection is None:
             self.connections[thead_id] = connection = sqlite3.connect(self.connection_string)
+            # Most pragmas only apply to the connection they are set on.
+            for key, value in self.DEFAULT_PRAGMA.items():
+                connection.execute(self._set_pragma_equal.format(key, value))
         return connection
 
     def close_blocking_connections(self, thead_id: int) -> None:
@@ -151,15 +153,12 @@ def close_blocking_connections(self, thead_id: int) -> None:
                 connection._connection = None
 
     def get(self, key: str, default: Any = None) -> Any:
-        result: Optional[tuple] = self.con.execute(self._get_sql, {"key": key}).fetchone()
+        data = {"key": key, "now": time()}
+        result: Optional[tuple] = self.con.execute(self._get_sql, data).fetchone()
 
         if result is None:
             return default
 
-        if datetime.now(tz=timezone.utc) >= datetime.fromtimestamp(result[1], tz=timezone.utc):
-            self.con.execute(self._delete_sql, {"key": key})
-            return default
-
         return self._unstream(result[0])
 
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
@@ -192,6 +191,9 @@ async def con(self) -> aiosqlite.Connection:
         connection = self.connections.get(thead_id)
         if connection is None:
             connection = await aiosqlite.connect(self.connection_string)
+            # Most pragmas only apply to the connection they are set on.
+            for key, value in self.DEFAULT_PRAGMA.items():
+                await connection.execute(self._set_pragma_equal.format(key, value))
             self.connections[thead_id] = connection
         return connection
 
@@ -201,18 +203,15 @@ def close_blocking_connections(self, thead_id: int) -> None:
             sync_connection.close()
 
     async def get(self, key: str, default: Any = None) -> Any:
+        data = {"key": key, "now": time()}
         con = await self.con
         cur: aiosqlite.Cursor
-        async with con.execute(self._get_sql, {"key": key}) as cur:
+        async with con.execute(self._get_sql, data) as cur:
             result: Optional[tuple] = await cur.fetchone()
 
         if result is None:
             return default
 
-        if datetime.now(tz=timezone.utc) >= datetime.fromtimestamp(result[1], tz=timezone.utc):
-            await con.execute(self._delete_sql, {"key": key})
-            return default
-
         return self._unstream(result[0])
 
     async def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
@@ -1,11 +1,13 @@
 import asyncio
 import json
-from contextlib import contextmanager
+from functools import cache
 from itertools import cycle as _cycle
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+from authlib.integrations.httpx_client import AsyncOAuth2Client, OAuth2Client
 from authlib.oauth2.rfc6749 import OAuth2Token
 
 from .cache import AsyncSQLiteCache, SQLiteCache
@@ -18,15 +20,20 @@
     DynamicsClientPostResponse,
     Generator,
     Iterator,
+    List,
     MethodType,
     Optional,
     PaginationRules,
     ResponseType,
+    Tuple,
+    Type,
     Union,
 )
-from .utils import Singletons
+from .utils import Singletons, sentinel
 
 if TYPE_CHECKING:
+    import ssl
+
     from .client.base import BaseDynamicsClient
 
 __all__ = [
@@ -42,6 +49,8 @@
 
 
 class ResponseMock:
+    __slots__ = ("response", "status_code")
+
     def __init__(self, *, response: ResponseType, status_code: int = 200) -> None:
         self.response = response
         self.status_code = status_code
@@ -58,10 +67,70 @@ def text(self) -> str:
         return json.dumps(self.response)  # pragma: no cover
 
 
+@cache
+def _ssl_context() -> "ssl.SSLContext":
+    return httpx.create_ssl_context()
+
+
+class _OAuth2Client(OAuth2Client):
+    """
+    Share a single SSL context between all mock clients. Loading the CA certificates
+    for a new context is by far the slowest part of creating a client.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("verify", _ssl_context())
+        super().__init__(*args, **kwargs)
+
+
+class _AsyncOAuth2Client(AsyncOAuth2Client):
+    """
+    Share a single SSL context between all async mock clients. Loading the CA certificates
+    for a new context is by far the slowest part of creating a client.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("verify", _ssl_context())
+        super().__init__(*args, **kwargs)
+
+
+class _MockContext:
+    """Replace the given class attributes when entered, and restore them in reverse order when exited."""
+
+    __slots__ = ("originals", "replacements")
+
+    def __init__(self, *replacements: Tuple[type, str, Any]) -> None:
+        self.replacements = replacements
+        self.originals: List[Tuple[type, str, Any]] = []
+
+    def __enter__(self) -> None:
+        try:
+            for owner, name, new in self.replacements:
+                original = vars(owner).get(name, sentinel)
+                setattr(owner, name, new)
+                self.originals.append((owner, name, original))
+        except BaseException:
+            self.__exit__()
+            raise
+
+    def __exit__(self, *args: object) -> None:
+        for owner, name, original in reversed(self.originals):
+            if original is sentinel:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+
 class BaseMockClient:
     """Base mock client"""
 
     _mocking_object: Union[MagicMock, AsyncMock]
+    _client_class: Type["BaseDynamicsClient"]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The mocked DynamicsClient is the last base, e.g. 'MockClient(BaseSyncMockClient, DynamicsClient)'
+        cls._client_class = cls.__bases__[-1]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         kwargs.setdefault("api_url", "http://dynamics.local/")
@@ -71,12 +140,12 @@ def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         kwargs.setdefault("scope", ["http://scope.local/"])
         super().__init__(**kwargs)
 
-        self.__len: int = -1
+        self.__len: Optional[int] = None
         self.__default_status: int = 200
         self.__internal: bool = False
         self.__response: ResponseType = None
-        self.__responses: Iterator[ResponseType] = _cycle([None])
-        self.__status_codes: Iterator[int] = _cycle([self.__default_status])
+        self.__responses: Optional[Iterator[ResponseType]] = None
+        self.__status_codes: Optional[Iterator[int]] = None
         self.__exceptions: Optional[Iterator[Optional[Exception]]] = None
 
     def with_responses(self, *responses: ResponseType, cycle: bool = False) -> "BaseMockClient":
@@ -169,63 +238,60 @@ def current_response(self) -> ResponseType:
         return self.__response
 
     def _check_length(self, length: int) -> "BaseMockClient":
-        if self.__len not in (length, -1):
+        if self.__len is not None and self.__len != length:
             msg = "Mismatching number of arguments given for MockResponse"
             raise ValueError(msg)
         self.__len = length
         return self
 
-    @contextmanager
-    def _mock_method(self, method: MethodType) -> Generator[Any, Any, None]:
-        try:
-            self.__response = next(self.__responses)
-        except StopIteration as error:
+    def _mock_method(self, method: MethodType) -> _MockContext:
+        response = next(self.__responses, sentinel) if self.__responses is not None else None
+        if response is sentinel:
             msg = "Ran out of responses on the MockClient"
-            raise ValueError(msg) from error
+            raise ValueError(msg)
+
+        self.__response = response
 
         token = OAuth2Token({"expires_in": "60"})
-        client_class: "BaseDynamicsClient" = self.__class__.__bases__[-1]  # type: ignore[assigment]
-        class_dot_path = f"{client_class.__module__}.{client_class.__qualname__}"
-        get_token_path = f"{class_dot_path}.get_token"
+        client_class = self._client_class
 
         if self.__internal:
-            try:
-                status_code = next(self.__status_codes)
-            except StopIteration as error:
+            status_code = (
+                next(self.__status_codes, sentinel) if self.__status_codes is not None else self.__default_status
+            )
+            if status_code is sentinel:
                 msg = "Ran out of status codes on the MockClient"
-                raise ValueError(msg) from error
+                raise ValueError(msg)
 
             response_mock = ResponseMock(response=self.__response, status_code=status_code)
             if method == "get" and isinstance(self.__response, dict):
-                self.__response = self.__response.get("value", [self.__response])
+                self.__response = self.__response["value"] if "value" in self.__response else [self.__response]  # noqa: SIM401
 
-            oauth_dot_path = f"{client_class.oauth_class.__module__}.{client_class.oauth_class.__qualname__}"
-            method_path = f"{oauth_dot_path}.{method}"
-            yield from self._mock_internal(method_path, get_token_path, token, response_mock)
-        else:
-            method_path = f"{class_dot_path}.{method}"
-            yield from self._mock_external(method_path, get_token_path, token)
+            return self._mock_internal(client_class, method, token, response_mock)
+        return self._mock_external(client_class, method, token)
 
     def _mock_internal(
         self,
-        method_path: str,
-        get_token_path: str,
+        client_class: Type["BaseDynamicsClient"],
+        method: MethodType,
         token: OAuth2Token,
         side_effect: ResponseMock,
-    ) -> Generator[Any, Any, None]:
-        with patch(method_path, new_callable=self._mocking_object, side_effect=[side_effect]):  # noqa: SIM117
-            with patch(get_token_path, return_value=token):
-                yield
+    ) -> _MockContext:
+        return _MockContext(
+            (client_class.oauth_class, method, self._mocking_object(side_effect=[side_effect])),
+            (client_class, "get_token", self._mocking_object(return_value=token)),
+        )
 
     def _mock_external(
         self,
-        method_path: str,
-        get_token_path: str,
+        client_class: Type["BaseDynamicsClient"],
+        method: MethodType,
         token: OAuth2Token,
-    ) -> Generator[Any, Any, None]:
-        with patch(method_path, new_callable=self._mocking_object, side_effect=[self.__response]):  # noqa: SIM117
-            with patch(get_token_path, return_value=token):
-                yield
+    ) -> _MockContext:
+        return _MockContext(
+            (client_class, method, self._mocking_object(side_effect=[self.__response])),
+            (client_class, "get_token", self._mocking_object(return_value=token)),
+        )
 
 
 class BaseSyncMockClient(BaseMockClient):
@@ -323,10 +389,14 @@ async def delete(self, *, query: Optional[str] = None, **kwargs: Any) -> None:
 class MockClient(BaseSyncMockClient, DynamicsClient):
     """A testing client for the Dynamics client."""
 
+    oauth_class = _OAuth2Client
+
 
 class AsyncMockClient(BaseASyncMockClient, aio.DynamicsClient):
     """A testing client for the Dynamics client."""
 
+    oauth_class = _AsyncOAuth2Client
+
 
 @pytest.fixture(scope="session")
 def _dynamics_cache_constructor() -> SQLiteCache:
@@ -366,14 +436,18 @@ def _dynamics_async_cache_constructor() -> AsyncSQLiteCache:
 @pytest.fixture
 def async_dynamics_cache(_dynamics_async_cache_constructor: AsyncSQLiteCache) -> Generator[AsyncSQLiteCache, Any, None]:
     """Get the session instance of either Django's cache or SQLiteCache."""
-    asyncio.run(_dynamics_async_cache_constructor.clear())
+    loop = asyncio.new_event_loop()
     try:
-        yield _dynamics_async_cache_constructor
-    finally:
+        loop.run_until_complete(_dynamics_async_cache_constructor.clear())
         try:
-            asyncio.run(_dynamics_async_cache_constructor.clear())
+            yield _dynamics_async_cache_constructor
         finally:
-            asyncio.run(_dynamics_async_cache_constructor.close())
+            try:
+                loop.run_until_complete(_dynamics_async_cache_constructor.clear())
+            finally:
+                loop.run_until_complete(_dynamics_async_cache_constructor.close())
+    finally:
+        loop.close()
 
 
 @pytest.fixture
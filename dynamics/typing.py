@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -14,25 +15,23 @@
     Literal,
     NamedTuple,
     Optional,
+    ParamSpec,
     Sequence,
     Set,
     Tuple,
     Type,
+    TypeAlias,
     TypedDict,
+    TypeGuard,
     TypeVar,
     Union,
 )
-
-# New in version 3.10
-try:
-    from typing import ParamSpec, TypeAlias, TypeGuard
-except ImportError:
-    from typing_extensions import ParamSpec, TypeAlias, TypeGuard
+from uuid import UUID
 
 # New in version 3.11
-try:
+if sys.version_info >= (3, 11):
     from typing import NotRequired, Required, Self
-except ImportError:
+else:
     from typing_extensions import NotRequired, Required, Self
 
 
@@ -45,7 +44,6 @@
     "ClassVar",
     "CompType",
     "Coroutine",
-    "Coroutine",
     "Dict",
     "DynamicsClientGetResponse",
     "DynamicsClientPatchResponse",
@@ -54,7 +52,6 @@
     "ExpandKeys",
     "ExpandType",
     "ExpandValues",
-    "ExpandValues",
     "FetchXMLAggregateType",
     "FetchXMLAttributeType",
     "FetchXMLBuildType",
@@ -113,11 +110,11 @@ class ExpandType(TypedDict):
 ExpandKeys: TypeAlias = Literal["select", "filter", "top", "orderby", "expand"]
 ExpandValues: TypeAlias = Union[List[str], Set[str], int, OrderbyType, Dict[str, ExpandType]]
 ExpandDict: TypeAlias = Dict[str, Optional[ExpandType]]
-FieldType: TypeAlias = Union[str, int, float, bool, None]
+FieldType: TypeAlias = Union[str, int, float, bool, UUID, None]
 CompType: TypeAlias = Union[str, int, float]
 T = TypeVar("T")
 P = ParamSpec("P")
-ResponseType: TypeAlias = Union[Union[Dict[str, Any], List[Dict[str, Any]]], Exception, None]
+ResponseType: TypeAlias = Union[Dict[str, Any], List[Dict[str, Any]], Exception, None]
 
 
 DynamicsOKResponse = TypedDict(
@@ -154,19 +151,19 @@ class DynamicsErrorResponse(TypedDict):
 DynamicsResponse: TypeAlias = Union[DynamicsOKResponse, DynamicsErrorResponse]
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicsClientGetResponse:
     data: List[Dict[str, Any]]
     count: Optional[int]
     next_link: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicsClientPostResponse:
     data: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicsClientPatchResponse:
     data: Dict[str, Any]
 
@@ -1,18 +1,14 @@
 import logging
+import re
 from datetime import datetime
 from functools import wraps
+from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING
-from uuid import UUID
+from zoneinfo import ZoneInfo
 
 from .cache import AsyncSQLiteCache, SQLiteCache
 from .exceptions import DynamicsException
-
-try:
-    from zoneinfo import ZoneInfo
-except ImportError:
-    from backports.zoneinfo import ZoneInfo
-
-from .typing import Any, Awaitable, Callable, Coroutine, List, Optional, P, T, Type, Union
+from .typing import Any, Awaitable, Callable, Coroutine, Optional, P, T, Tuple, Type, Union
 
 if TYPE_CHECKING:
     from django.core.cache import BaseCache
@@ -33,17 +29,16 @@
 
 logger = logging.getLogger(__name__)
 
+# Matches the canonical form 'str(UUID(...))' produces: lowercase, hyphenated, no braces.
+_UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
 
 class sentinel:  # noqa: N801
     """Sentinel value."""
 
 
 def is_valid_uuid(value: str) -> bool:
-    try:
-        uuid = UUID(value)
-        return str(uuid) == value
-    except Exception:  # noqa: BLE001
-        return False
+    return isinstance(value, str) and _UUID_PATTERN.fullmatch(value) is not None
 
 
 def to_dynamics_date_format(date: datetime, from_timezone: Optional[str] = None) -> str:
@@ -52,7 +47,7 @@ def to_dynamics_date_format(date: datetime, from_timezone: Optional[str] = None)
 
     :param date: Datetime object.
     :param from_timezone: Time zone name from the IANA Time Zone Database the date is in.
-                          Dynamics dates are in UCT, so timezoned values need to be converted to it.
+                          Dynamics dates are in UTC, so timezoned values need to be converted to it.
     """
     if from_timezone is not None and date.tzinfo is None:
         date: datetime = date.replace(tzinfo=ZoneInfo(from_timezone))
@@ -63,16 +58,16 @@ def to_dynamics_date_format(date: datetime, from_timezone: Optional[str] = None)
     return date.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
 
 
-def from_dynamics_date_format(date: str, to_timezone: str = "UCT") -> datetime:
+def from_dynamics_date_format(date: str, to_timezone: str = "UTC") -> datetime:
     """
     Convert a Dynamics compatible ISO formatted date string to a datetime-object.
 
     :param date: Date string in form: YYYY-mm-ddTHH:MM:SSZ
     :param to_timezone: Time zone name from the IANA Time Zone Database to convert the date to.
-                        This won't add 'tzinfo', instead the actual time part will be changed from UCT
+                        This won't add 'tzinfo', instead the actual time part will be changed from UTC
                         to what the time is at 'to_timezone'.
     """
-    local_time = datetime.fromisoformat(date.replace("Z", "")).replace(tzinfo=ZoneInfo(to_timezone))
+    local_time = datetime.fromisoformat(date.removesuffix("Z")).replace(tzinfo=ZoneInfo(to_timezone))
     local_time += local_time.utcoffset()
     return local_time.replace(tzinfo=None)
 
@@ -122,13 +117,13 @@ def error_simplification_available(func: Callable[P, T]) -> Callable[P, T]:
     @wraps(func)
     def inner(*args: P.args, **kwargs: P.kwargs) -> T:
         simplify_errors: bool = kwargs.pop("simplify_errors", False)
-        raise_separately: List[Type[Exception]] = kwargs.pop("raise_separately", [])
+        raise_separately: Tuple[Type[Exception], ...] = tuple(kwargs.pop("raise_separately", ()))
 
         try:
             return func(*args, **kwargs)
         except Exception as error:
             logger.warning(error)
-            if not simplify_errors or any(isinstance(error, exception) for exception in raise_separately):
+            if not simplify_errors or isinstance(error, raise_separately):
                 raise
             self: "DynamicsClient" = args[0]
             raise DynamicsException(self.simplified_error_message) from error
@@ -137,7 +132,9 @@ def inner(*args: P.args, **kwargs: P.kwargs) -> T:
 
 
 def to_coroutine(func: Callable[P, T]) -> Callable[P, Coroutine[Awaitable[T], Any, Any]]:
-    """Convert passed callable into a coroutine."""
+    """Convert passed callable into a coroutine. Coroutine functions are returned as is."""
+    if iscoroutinefunction(func):
+        return func
 
     @wraps(func)
     async def wrapper(*args: P.args, **kw: P.kwargs) -> Any:
@@ -1,5 +1,10 @@
+from unittest.mock import patch
+
+import httpx
 import pytest
 
+from dynamics.test import _MockContext, _ssl_context
+
 
 def test_mock_client__next_exception_before_exceptions_set(dynamics_client):
     with pytest.raises(TypeError, match="Cannot call 'next_exception' without setting exceptions first"):
@@ -25,3 +30,34 @@ def test_mock_client__too_few_status_codes(dynamics_client):
 
     with pytest.raises(ValueError, match="Ran out of status codes on the MockClient"):
         dynamics_client.delete()
+
+
+def test_mock_client__ssl_context_is_shared(dynamics_client):
+    _ssl_context.cache_clear()
+    with patch("httpx.create_ssl_context", wraps=httpx.create_ssl_context) as create_ssl_context:
+        type(dynamics_client)()
+        type(dynamics_client)()
+
+    assert create_ssl_context.call_count == 1
+
+
+def test_async_mock_client__ssl_context_is_shared(async_dynamics_client):
+    _ssl_context.cache_clear()
+    with patch("httpx.create_ssl_context", wraps=httpx.create_ssl_context) as create_ssl_context:
+        type(async_dynamics_client)()
+        type(async_dynamics_client)()
+
+    assert create_ssl_context.call_count == 1
+
+
+def test_mock_client__mock_context__rollback_on_failed_replacement():
+    class Owner:
+        foo = 1
+
+    context = _MockContext((Owner, "foo", 2), (Owner, "bar", 3), (object, "foo", 4))
+
+    with pytest.raises(TypeError):
+        context.__enter__()
+
+    assert Owner.foo == 1
+    assert not hasattr(Owner, "bar")
@@ -1,6 +1,9 @@
+from decimal import Decimal
+from uuid import UUID
+
 import pytest
 
-from dynamics.query_functions import ftr
+from dynamics.query_functions import _type, ftr
 from dynamics.typing import Any
 
 
@@ -15,6 +18,29 @@ def test_query_functions__eq(ind: str, group: bool, result: str):
     assert ftr.eq("foo", "bar", ind, group) == result
 
 
+def test_query_functions__eq__cached_by_type():
+    assert ftr.eq("foo", 1) == "foo eq 1"
+    assert ftr.eq("foo", True) == "foo eq true"
+    assert ftr.eq("foo", 1.0) == "foo eq 1.0"
+    assert ftr.eq("foo", 0.0) == "foo eq 0.0"
+    assert ftr.eq("foo", -0.0) == "foo eq -0.0"
+    assert ftr.eq("foo", Decimal("1.5")) == "foo eq 1.5"
+    assert ftr.eq("foo", Decimal("1.50")) == "foo eq 1.50"
+
+
+def test_query_functions__contains__cached_by_type():
+    assert ftr.contains("foo", 0.0) == "contains(foo,'0.0')"
+    assert ftr.contains("foo", -0.0) == "contains(foo,'-0.0')"
+    assert ftr.contains("foo", Decimal("1.5")) == "contains(foo,'1.5')"
+    assert ftr.contains("foo", Decimal("1.50")) == "contains(foo,'1.50')"
+
+
+def test_query_functions__eq__uuid():
+    value = "0a8dc1c8-cd5f-4b5e-9f34-6c3d7d0a6a5b"
+    assert ftr.eq("foo", UUID(value)) == f"foo eq {value}"
+    assert ftr.eq("foo", value) == f"foo eq {value}"
+
+
 @pytest.mark.parametrize(
     "ind,group,result",
     [
@@ -970,6 +996,23 @@ def test_query_functions__equal_user_teams(ind: str, group: bool, result: str):
     assert ftr.equal_user_teams("foo", ind, group) == result
 
 
+def test_query_functions__special_single_value__cached_by_type():
+    assert ftr.on("foo", 1) == "Microsoft.Dynamics.CRM.On(PropertyName='foo',PropertyValue='1')"
+    assert ftr.on("foo", True) == "Microsoft.Dynamics.CRM.On(PropertyName='foo',PropertyValue=true)"
+    assert ftr.above("foo", 0.0) == "Microsoft.Dynamics.CRM.Above(PropertyName='foo',PropertyValue='0.0')"
+    assert ftr.above("foo", -0.0) == "Microsoft.Dynamics.CRM.Above(PropertyName='foo',PropertyValue='-0.0')"
+    assert ftr.last_x_days("foo", Decimal("-0")) == "Microsoft.Dynamics.CRM.LastXDays(PropertyName='foo',PropertyValue=-0)"
+    assert ftr.last_x_days("foo", Decimal("0")) == "Microsoft.Dynamics.CRM.LastXDays(PropertyName='foo',PropertyValue=0)"
+
+
+def test_query_functions__special_two_values__cached_by_type():
+    result = "Microsoft.Dynamics.CRM.InFiscalPeriodAndYear(PropertyName='foo',PropertyValue1={},PropertyValue2=1)"
+    assert ftr.in_fiscal_period_and_year("foo", 0.0, 1) == result.format("0.0")
+    assert ftr.in_fiscal_period_and_year("foo", -0.0, 1) == result.format("-0.0")
+    assert ftr.in_fiscal_period_and_year("foo", Decimal("-0"), 1) == result.format("-0")
+    assert ftr.in_fiscal_period_and_year("foo", Decimal("0"), 1) == result.format("0")
+
+
 @pytest.mark.parametrize(
     "value,quotes,result",
     [
@@ -981,4 +1024,4 @@ def test_query_functions__equal_user_teams(ind: str, group: bool, result: str):
     ],
 )
 def test_query_functions__type(value: Any, quotes: bool, result: str):
-    assert ftr._type(value, quotes) == result
+    assert _type(value, quotes) == result
@@ -11,6 +11,8 @@
     [
         ["08177f42-ea48-414e-9ee9-41a838b09237", True],
         ["08177f42-ea48-414e-41a838b09237", False],
+        ["08177F42-EA48-414E-9EE9-41A838B09237", False],
+        ["{08177f42-ea48-414e-9ee9-41a838b09237}", False],
         ["", False],
         [None, False],
     ],
@@ -54,3 +56,14 @@ def func():
     assert iscoroutinefunction(coro)
     assert coro != func
     assert await coro() == 1
+
+
+@pytest.mark.asyncio
+async def test_to_coroutine__already_coroutine():
+    async def func():
+        return 1
+
+    coro = to_coroutine(func)
+
+    assert coro is func
+    assert await coro() == 1